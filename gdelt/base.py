@@ -1,8 +1,10 @@
 import datetime
 import json
 import os
+import pickle
 from functools import partial
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 
 import pandas as pd
 import requests
@@ -10,9 +12,8 @@ import requests
 from gdelt.dateFuncs import (dateRanger, gdeltRangeString)
 from gdelt.getHeaders import events1Heads, events2Heads, mentionsHeads, \
     gkgHeads
-from gdelt.helpers import cameos
 from gdelt.inputChecks import (dateInputCheck)
-from gdelt.parallel import mp_worker
+from gdelt.parallel import mp_worker, sizeSession
 from gdelt.vectorizingFuncs import urlBuilder
 
 ##############################################
@@ -25,18 +26,69 @@ BASE_DIR = os.path.dirname(this_dir)
 
 UTIL_FILES_PATH = os.path.join(BASE_DIR, "gdeltPyR", "utils", "schema_csvs")
 
+# downloaded CAMEO codes are kept here so later imports skip the network
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gdeltPyR")
+CAMEO_CACHE = os.path.join(CACHE_DIR, "cameoCodes.pkl")
+
 try:
 
-    codes = json.load(open(os.path.join(UTIL_FILES_PATH,
-                                        "cameoCodes.json")))
+    with open(os.path.join(UTIL_FILES_PATH, "cameoCodes.json")) as f:
+        codes = json.load(f)
 
 
 except:
 
-    a = 'https://raw.githubusercontent.com/linwoodc3/gdeltPyR/master' \
-        '/utils/' \
-        'schema_csvs/cameoCodes.json'
-    codes = json.loads((requests.get(a).content.decode('utf-8')))
+    try:
+        with open(CAMEO_CACHE, 'rb') as f:
+            codes = pickle.load(f)
+
+    except:
+
+        a = 'https://raw.githubusercontent.com/linwoodc3/gdeltPyR/master' \
+            '/utils/' \
+            'schema_csvs/cameoCodes.json'
+        codes = json.loads((requests.get(a).content.decode('utf-8')))
+
+        try:
+            if not os.path.isdir(CACHE_DIR):
+                os.makedirs(CACHE_DIR)
+            with open(CAMEO_CACHE, 'wb') as f:
+                pickle.dump(codes, f, protocol=2)
+        except (IOError, OSError):
+            pass  # caching is best effort; a read-only home is fine
+
+##################################
+# Partial Functions
+#################################
+
+v1RangerCoverage = partial(gdeltRangeString, version=1, coverage=True)
+v2RangerCoverage = partial(gdeltRangeString, version=2, coverage=True)
+v1RangerNoCoverage = partial(gdeltRangeString, version=1, coverage=False)
+v2RangerNoCoverage = partial(gdeltRangeString, version=2, coverage=False)
+
+urlsv1gkg = partial(urlBuilder, version=1, table='gkg')
+urlsv2mentions = partial(urlBuilder, version=2, table='mentions')
+urlsv2events = partial(urlBuilder, version=2, table='events')
+urlsv1events = partial(urlBuilder, version=1, table='events')
+urlsv2gkg = partial(urlBuilder, version=2, table='gkg')
+
+eventWork = partial(mp_worker, table='events')
+gkgWork = partial(mp_worker, table='gkg')
+
+# (version, table, coverage) -> function building the download urls from
+# the dateRanger output. GDELT 1.0 is daily, so coverage does not apply.
+downloadBuilders = {
+    (1, 'events', True): lambda d: urlsv1events(v1RangerCoverage(d)),
+    (1, 'events', False): lambda d: urlsv1events(v1RangerNoCoverage(d)),
+    (1, 'gkg', True): lambda d: urlsv1gkg(v1RangerCoverage(d)),
+    (1, 'gkg', False): lambda d: urlsv1gkg(v1RangerCoverage(d)),
+    (2, 'events', True): lambda d: urlsv2events(v2RangerCoverage(d)),
+    (2, 'events', False): lambda d: urlsv2events(v2RangerNoCoverage(d)),
+    (2, 'gkg', True): lambda d: urlsv2gkg(v2RangerCoverage(d)),
+    (2, 'gkg', False): lambda d: urlsv2gkg(v2RangerNoCoverage(d)),
+    (2, 'mentions', True): lambda d: urlsv2mentions(v2RangerCoverage(d)),
+    (2, 'mentions', False): lambda d: urlsv2mentions(v2RangerNoCoverage(d)),
+}
 
 ##############################
 # Core GDELT class
@@ -60,8 +112,10 @@ class gdelt(object):
             Base url for GDELT 1.0 services.
         cores : int, optional, default:
             Count of total CPU cores available.
-        pool: function
-            Standard multiprocessing function to establish Pool workers
+        pool: multiprocessing.pool.Pool, optional, default: None
+            Worker pool used for parallel downloads. When None, a thread
+            pool is created on the first multi-file query and reused by
+            later queries until ``close()`` is called.
 
         Attributes
         ----------
@@ -120,21 +174,49 @@ class gdelt(object):
     def __init__(self,
                  gdelt2url='http://data.gdeltproject.org/gdeltv2/',
                  gdelt1url='http://data.gdeltproject.org/events/',
-                 version=2.0,
+                 version=2,
                  cores=cpu_count(),
-                 pool=Pool(processes=cpu_count())
+                 pool=None
 
                  ):
 
-        self.version = version
+        self.version = int(version)
         self.cores = cores
-        self.pool = pool
-        if int(version) == 2:
+        self._ownsPool = False
+        self._pool = pool
+        if self.version == 2:
             self.baseUrl = gdelt2url
-        elif int(version) == 1:
+        elif self.version == 1:
             self.baseUrl = gdelt1url
         self.codes = codes
 
+    @property
+    def pool(self):
+        """Worker pool for parallel downloads, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPool(processes=self.cores * 4)
+            self._ownsPool = True
+        return self._pool
+
+    @pool.setter
+    def pool(self, pool):
+        self.close()
+        self._pool = pool
+
+    def close(self):
+        """Terminate the download pool if this object created it.
+
+        A pool passed in by the caller is left running; the caller owns it.
+        """
+        if self._ownsPool:
+            self._pool.terminate()
+            self._pool = None
+            self._ownsPool = False
+
+    def __del__(self):
+        if getattr(self, '_ownsPool', False):
+            self.close()
+
     ###############################
     # Searcher function for GDELT
     ###############################
@@ -144,46 +226,27 @@ class gdelt(object):
                table='events',
                headers=None,
                coverage=None,
-               queryTime=datetime.datetime.now().strftime('%m-%d-%Y %H:%M:%S')
+               queryTime=None
                ):
         """Placeholder text"""
+        if queryTime is None:
+            queryTime = datetime.datetime.now().strftime('%m-%d-%Y %H:%M:%S')
+        self.queryTime = queryTime
         dateInputCheck(date, self.version)
         self.coverage = coverage
         self.date = date
         version = self.version
         baseUrl = self.baseUrl
-        self.table = table
+        self.table = table or 'events'  # '' selects the default table
         self.datesString = gdeltRangeString(dateRanger(self.date),
                                             version=version,
                                             coverage=self.coverage)
 
-        ##################################
-        # Partial Functions
-        #################################
-
-        v1RangerCoverage = partial(gdeltRangeString, version=1,
-                                   coverage=True)
-        v2RangerCoverage = partial(gdeltRangeString, version=2,
-                                   coverage=True)
-        v1RangerNoCoverage = partial(gdeltRangeString, version=1,
-                                     coverage=False)
-        v2RangerNoCoverage = partial(gdeltRangeString, version=2,
-                                     coverage=False)
-
-        urlsv1gkg = partial(urlBuilder, version=1, table='gkg')
-        urlsv2mentions = partial(urlBuilder, version=2, table='mentions')
-        urlsv2events = partial(urlBuilder, version=2, table='events')
-        urlsv1events = partial(urlBuilder, version=1, table='events')
-        urlsv2gkg = partial(urlBuilder, version=2, table='gkg')
-
-        eventWork = partial(mp_worker, table='events')
-        codeCams = partial(cameos, codes=codes)
-
         #####################################
         # GDELT Version 2.0 Headers
         #####################################
 
-        if int(self.version) == 2:
+        if self.version == 2:
             ###################################
             # Download 2.0 Headers
             ###################################
@@ -196,9 +259,9 @@ class gdelt(object):
         # GDELT Version 1.0 Analytics, Header, Downloads
         #####################################
 
-        if int(self.version) == 1:
+        if self.version == 1:
 
-            if self.table is "mentions":
+            if self.table == "mentions":
                 raise BaseException('GDELT 1.0 does not have the "mentions'
                                     ' table. Specify the "events" or "gkg"'
                                     'table.')
@@ -208,63 +271,22 @@ class gdelt(object):
             self.events_columns = events1Heads()
             columns = self.events_columns
 
-
-            if self.table == 'gkg':
-                self.download_list = (urlsv1gkg(v1RangerCoverage(
-                    dateRanger(self.date))))
-
-            elif self.table == 'events' or self.table == '':
-
-                if self.coverage is True:
-
-                    self.download_list = (urlsv1events(v1RangerCoverage(
-                        dateRanger(self.date))))
-
-                else:
-                    # print("I'm here at line 125")
-                    self.download_list = (urlsv1events(v1RangerNoCoverage(
-                        dateRanger(self.date))))
-            else:
-                raise Exception('You entered an incorrect table type for '
-                                'GDELT 1.0.')
-
         #####################################
         # GDELT Version 2.0 Analytics and Download
         #####################################
         elif self.version == 2:
 
-            if self.table == 'events' or self.table == '':
-                columns = self.events_columns
-                if self.coverage is True:
-
-                    self.download_list = (urlsv2events(v2RangerCoverage(
-                        dateRanger(self.date))))
-                else:
-                    self.download_list = (urlsv2events(v2RangerNoCoverage(
-                        dateRanger(self.date))))
-
-            if self.table == 'gkg':
-                columns = self.gkg_columns
-                if self.coverage is True:
-
-                    self.download_list = (urlsv2gkg(v2RangerCoverage(
-                        dateRanger(self.date))))
-                else:
-                    self.download_list = (urlsv2gkg(v2RangerNoCoverage(
-                        dateRanger(self.date))))
-                    # print ("2 gkg", urlsv2gkg(self.datesString))
-
-            if self.table == 'mentions':
-                columns = self.mentions_columns
-                if self.coverage is True:
-
-                    self.download_list = (urlsv2mentions(v2RangerCoverage(
-                        dateRanger(self.date))))
-
-                else:
+            columns = {'events': self.events_columns,
+                       'gkg': self.gkg_columns,
+                       'mentions': self.mentions_columns}.get(self.table)
 
-                    self.download_list = (urlsv2mentions(v2RangerNoCoverage(
-                        dateRanger(self.date))))
+        try:
+            builder = downloadBuilders[(self.version, self.table,
+                                        self.coverage is True)]
+        except KeyError:
+            raise Exception('You entered an incorrect table type for '
+                            'GDELT {0}.0.'.format(self.version))
+        self.download_list = builder(dateRanger(self.date))
 
         #########################
         # DEBUG Print
@@ -277,37 +299,33 @@ class gdelt(object):
         # Download section
         #########################
 
-        if isinstance(self.datesString, str):
+        if self.table == 'events':
+            worker = eventWork
+        elif self.table == 'gkg' and self.version == 1:
+            worker = gkgWork  # GDELT 1.0 gkg files carry their header row
+        else:
+            worker = mp_worker
 
-            if self.table == 'events':
+        if isinstance(self.datesString, str):
 
-                results = eventWork(self.download_list)
-            else:
-                results = mp_worker(self.download_list)
+            results = worker(self.download_list)
         else:
 
-            if self.table == 'events':
-                p
-                pool = Pool(processes=cpu_count())
-                downloaded_dfs = list(pool.imap_unordered(eventWork,
-                                                          self.download_list))
+            # batching urls only saves pickling/IPC on a process pool; on
+            # threads it would serialise downloads of uneven file sizes
+            if isinstance(self.pool, ThreadPool):
+                # one keep-alive connection per download thread
+                sizeSession(self.cores * 4)
+                chunks = 1
             else:
-
-                pool = Pool(processes=cpu_count())
-                downloaded_dfs = list(pool.imap_unordered(mp_worker,
-                                                          self.download_list))
-            pool.close()
-            pool.terminate()
-            pool.join()
-            results = pd.concat(downloaded_dfs)
+                # process workers each build their own session
+                chunks = max(1, len(self.download_list) // (self.cores * 4))
+            downloaded_dfs = list(self.pool.imap_unordered(
+                worker, self.download_list, chunksize=chunks))
+            results = pd.concat(downloaded_dfs, ignore_index=True)
             del downloaded_dfs
-            results.reset_index(drop=True, inplace=True)
 
-        if self.table == 'gkg' and self.version == 1:
-            results.columns = results.ix[0].values.tolist()
-            results.drop([0], inplace=True)
-
-        else:
+        if worker is not gkgWork:
             results.columns = columns
 
         if (len(results)) == 0:
@@ -317,7 +335,10 @@ class gdelt(object):
 
         # Add column of human readable codes; need updated CAMEO
         if self.table == 'events':
-            cameoDescripts = results.EventCode.apply(codeCams)
+            cameoDescripts = results.EventCode.map(codes['Description'])
+            missing = cameoDescripts.isnull()
+            cameoDescripts[missing] = results.EventCode[missing].map(
+                'No Description returned for CAMEO code {0}'.format)
 
             results.insert(27, 'CAMEOCodeDescription',
                            value=cameoDescripts.values)
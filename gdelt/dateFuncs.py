@@ -2,24 +2,64 @@ import datetime
 import warnings
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 from gdelt.vectorizingFuncs import vectorizer
 
+##############################
+# 15 minute GDELT 2.0 update times
+##############################
+
+_TIMES_PER_DAY = np.array(['{0:02d}{1:02d}00'.format(hour, minute)
+                           for hour in range(24)
+                           for minute in range(0, 60, 15)])
+
+
+# user date strings repeat across queries; keep up to 1024 parsed results
+_parsedDates = {}
+
 
 def parse_date(var):
     """Return datetime object from string."""
 
+    if var in _parsedDates:
+        return _parsedDates[var]
     try:
-        return np.where(isinstance(parse(var), datetime.datetime),
-                        parse(var), "Error")
+        parsed = parse(var)
     except Exception as e:
         return "You entered an incorrect date.  Check your date format."
 
+    if not isinstance(parsed, datetime.datetime):
+        return "Error"
+    if len(_parsedDates) < 1024:
+        _parsedDates[var] = parsed
+    return parsed
+
+
+def dayStamps(days, intervals=96):
+    """Returns the GDELT 2.0 15 minute datestrings for each day in days.
 
-def dateFormatter(datearray):
-    """Function to format strings for numpy arange"""
-    return parse(datearray).strftime("%Y-%m-%d")
+    Every date prefix is broadcast against the time suffixes in a single
+    numpy string add, giving a flat array ordered by day then time.
+    """
+    dates = np.array([day.strftime('%Y%m%d') for day in days])
+    return np.char.add(dates[:, np.newaxis],
+                       _TIMES_PER_DAY[:intervals]).ravel()
+
+
+def dateParser(dateArray):
+    """Parses a list of date strings into an array of datetime objects.
+
+    Each string is parsed on its own (pandas' format='mixed') so a list
+    such as ['13/01/2016', '01/02/2016'] reads the same way dateutil and
+    dateInputCheck read it. pandas versions without format='mixed'
+    parse each string with dateutil.
+    """
+    try:
+        return pd.to_datetime(dateArray, format='mixed').to_pydatetime()
+    except ValueError:
+        return np.array([parse(x) for x in dateArray])
 
 
 def dateRanger(originalArray):
@@ -40,17 +80,6 @@ def dateRanger(originalArray):
         Returns self.
     """
 
-    minutes = list(map(str, range(00, 60, 15)))
-    hours = list(map(str, range(0, 24)))
-    times = []
-    for l in hours:
-        if int(l) < 10:
-            l = "0" + l
-        for k in minutes:
-            if k == "0":
-                k = '00'
-            times.append('{0}:{1}'.format(l, k))
-
     if isinstance(originalArray, str):
         """Check user input to retrieve date query."""
 
@@ -62,29 +91,15 @@ def dateRanger(originalArray):
         if len(originalArray) == 1:
             return np.array(parse("".join(originalArray)))
         elif len(originalArray) > 2:
-            #
-            #             return np.array(map(parse,originalArray),dtype='datetime64[D]').tolist()
-            return np.array(list(map(lambda x: parse(x), originalArray)))
+            return dateParser(originalArray)
         else:
 
-            cleaner = np.vectorize(dateFormatter)
-            converted = cleaner(originalArray).tolist()
-            dates = np.arange(converted[0], converted[1],
-                              dtype='datetime64[D]')
-            dates = list(map(lambda x: datetime.datetime.combine(
-                x, datetime.datetime.min.time()), dates.tolist()))
-            if len(originalArray) == 2:
-                adder = np.datetime64(parse(converted[1]).date())
-                adder = datetime.datetime.combine(adder.tolist(),
-                                                  datetime.datetime.min.time())
-                return np.append(dates,
-                                 adder)  # numpy range is not endpoint inclusive
-            else:
-                pass
-            return np.array(dates)
+            start, end = dateParser(originalArray)
+            return pd.date_range(start.date(), end.date(),
+                                 freq='D').to_pydatetime()
 
 
-def gdeltRangeString(element, coverage=None, version=2.0):
+def gdeltRangeString(element, coverage=None, version=2):
     """Takes a numpy datetime and converts to string"""
 
     ########################
@@ -96,54 +111,33 @@ def gdeltRangeString(element, coverage=None, version=2.0):
     #     Current day check
     ########################
 
-
-    minutes = list(map(str, range(00, 60, 15)))
-    hours = list(map(str, range(0, 24)))
-    times = []
-    for l in hours:
-        if int(l) < 10:
-            l = "0" + l
-        for k in minutes:
-            if k == "0":
-                k = '00'
-            times.append('{0}:{1}'.format(l, k))
-
     element = element.tolist()
 
-    hour = datetime.datetime.now().hour
-    multiplier = (datetime.datetime.now().minute // 15)
+    now = datetime.datetime.now()
+    hour = now.hour
+    multiplier = (now.minute // 15)
     multiple = 15 * multiplier
     conditioner = multiplier + 1
 
     # calculate nearest 15 minute interval
     if not isinstance(element, list):
 
-        if element.date() == datetime.datetime.now().date():
-            if coverage and int(version) != 1:
+        if element.date() == now.date():
+            if coverage and version != 1:
 
-                converted = np.array(
-                    list(map(
-                        lambda x: np.datetime64(parse(str(element) + " " + x)
-                                                ).tolist().strftime(
-                            '%Y%m%d%H%M%S'
-                        ), times[:hour * 4 + conditioner])))
+                converted = dayStamps([element], hour * 4 + conditioner)
             else:
-                converted = datetime.datetime.now().replace(
+                converted = now.replace(
                     minute=multiple, second=0).strftime('%Y%m%d%H%M%S')
 
         else:
-            if coverage and int(version) != 1:
-
-                converted = restOfDay = np.array(
-                    list(map(
-                        lambda x: np.datetime64(parse(str(element) + " " + x)
-                                                ).tolist().strftime(
-                            '%Y%m%d%H%M%S'
-                        ), times[:])))
+            if coverage and version != 1:
+
+                converted = dayStamps([element])
             else:
 
-                converted = element.replace(minute=int(
-                    multiple), second=0).strftime('%Y%m%d%H%M%S')
+                converted = element.replace(minute=multiple,
+                                            second=0).strftime('%Y%m%d%H%M%S')
 
 
     #################################
@@ -176,17 +170,9 @@ def gdeltRangeString(element, coverage=None, version=2.0):
         ####################
         # Return all 15 min intervals
         ####################
-        if coverage and int(version) != 1:
-
-            converted = []
-            for i in element:
-                converted.append(np.array(
-                    list(map(
-                        lambda x: np.datetime64(parse(str(i) + " " + x)
-                                                ).tolist().strftime(
-                            '%Y%m%d%H%M%S'
-                        ), times[:]))))
-            converted = np.concatenate(converted, axis=0)
+        if coverage and version != 1:
+
+            converted = dayStamps(element)
             if len(converted.tolist()) >= (5 * 192):
                 warnText = ("This query will download {0} files, and likely "
                             "exhaust your memory with possibly 10s of "
@@ -198,35 +184,30 @@ def gdeltRangeString(element, coverage=None, version=2.0):
     ########################
     # Version 1 Datestrings
     #########################
-    if int(version) == 1:
+    if version == 1:
         if isinstance(converted, list) is True:
 
-            converted = list(
-                map(lambda x: np.where((parse(x) >= parse(
-                    '2013 04 01')), parse(x).strftime('%Y%m%d%H%M%S')[:8],
-                                       np.where((parse(x) < parse(
-                                           '2006 01 01') and (
-                                                     int(version) == 1)),
-                                                parse(x).strftime(
-                                                    '%Y%m%d%H%M%S')[:4],
-                                                parse(x).strftime(
-                                                    '%Y%m%d%H%M%S')[:6]))
-                    , converted))
-            converted = list(map(lambda x: x.tolist(), converted))
-            converted = list(set(converted))  # account for duplicates
+            converted = list(set(v1Trimmer(converted)))  # account for duplicates
         else:
-            converted = np.where((parse(converted) >= parse('2013 04 01')),
-                                 parse(converted).strftime('%Y%m%d%H%M%S')[:8],
-                                 np.where((parse(converted) < parse(
-                                     '2006 01 01') and (int(version) == 1)),
-                                          parse(converted).strftime(
-                                              '%Y%m%d%H%M%S')[:4],
-                                          parse(converted).strftime(
-                                              '%Y%m%d%H%M%S')[:6])).tolist()
+            converted = v1Trimmer([converted])[0]
 
     return converted
 
 
+def v1Trimmer(stamps):
+    """Trims GDELT datestrings to the GDELT 1.0 file naming scheme.
+
+    GDELT 1.0 publishes daily files from April 1 2013, monthly files from
+    2006 and yearly files before that, so each '%Y%m%d%H%M%S' string is
+    cut to 8, 6 or 4 characters respectively.
+    """
+    dates = np.array([parse(x) for x in stamps], dtype='datetime64[s]')
+    lengths = np.select([dates >= np.datetime64('2013-04-01'),
+                         dates < np.datetime64('2006-01-01')],
+                        [8, 4], default=6)
+    return [x[:length] for x, length in zip(stamps, lengths)]
+
+
 def dateMasker(dateString, version):
     mask = (np.where((int(version == 1) and parse(dateString) >= parse(
         '2013 04 01')) or (int(version) == 2),
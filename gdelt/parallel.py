@@ -1,52 +1,86 @@
-import datetime
 import multiprocessing
 import os
 import re
 import time
 import warnings
 from io import BytesIO
-from multiprocessing import current_process
 
 import pandas as pd
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+##############################
+# Shared HTTP session
+##############################
+
+# One keep-alive session per process so repeated GETs against
+# data.gdeltproject.org reuse pooled TCP connections instead of
+# opening a new one for every url. A forked child must not reuse the
+# parent's sockets, so the session is rebuilt whenever the pid changes.
+_session = None
+_sessionPid = None
+_sessionSize = DEFAULT_POOLSIZE
+
+
+def _getSession():
+    """Return this process's shared session, creating it if needed"""
+    global _session, _sessionPid
+    if _sessionPid != os.getpid():
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=_sessionSize)
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+        _sessionPid = os.getpid()
+    return _session
+
+
+def sizeSession(workers):
+    """Keep at least one pooled connection per download thread"""
+    global _sessionSize
+    if workers > _sessionSize:
+        session = _getSession()
+        replaced = set(session.adapters.values())
+        adapter = HTTPAdapter(pool_maxsize=workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for old in replaced:
+            old.close()
+        _sessionSize = workers
+
+
+def _fetch(url):
+    """Download a url over the shared session"""
+    return _getSession().get(url)
+
+
+def _decode(content, table=None):
+    """Parse the bytes of a zipped GDELT file into a dataframe"""
+    # low_memory=False parses each file in a single pass and infers one
+    # dtype per column instead of re-inferring chunk by chunk
+    buffer = BytesIO(content)
+    if table == 'events':
+        frame = pd.read_csv(buffer, compression='zip', sep='\t',
+                            header=None,
+                            dtype={26: 'str', 27: 'str', 28: 'str'},
+                            parse_dates=[1, 2], low_memory=False)
+
+    elif table == 'gkg':
+        frame = pd.read_csv(buffer, compression='zip', sep='\t',
+                            parse_dates=['DATE'], low_memory=False)
+
+    else:
+
+        frame = pd.read_csv(buffer, compression='zip', sep='\t',
+                            header=None, low_memory=False)
+    buffer.close()
+    return frame
 
 
 def mp_worker(url, table=None):
     """Code to download the urls and blow away the buffer to keep memory usage down"""
-    warnings.filterwarnings("ignore",
-                            '.*have mixed types. Specify dtype.*')  # ignore pandas warning for GDELT 1.0 dtype
-    start = datetime.datetime.now()
-    proc_name = current_process().name
-
-    # print (multiprocessing.current_process().name)
-    proc = os.getpid()
-    # print ('Starting {0}-{1}'.format(proc_name,proc))
-    r = requests.get(url)
-    # print (multiprocessing.Process(name=multiprocessing.current_process().name).is_alive())
+    r = _fetch(url)
     try:
-        buffer = BytesIO(r.content)
-        if table == 'events':
-
-
-            frame = pd.read_csv(buffer, compression='zip', sep='\t',
-                                header=None, warn_bad_lines=False,
-                                dtype={26: 'str', 27: 'str', 28: 'str'},
-                                parse_dates=[1, 2])
-
-
-        elif table == 'gkg':
-            frame = pd.read_csv(buffer, compression='zip', sep='\t',
-                                parse_dates=['DATE'], warn_bad_lines=False)
-
-        else:
-
-            frame = pd.read_csv(buffer, compression='zip', sep='\t',
-                                header=None, warn_bad_lines=False)
-        end = datetime.datetime.now() - start
-        # print ("{0} with id {1} finished processing in {2}".format(proc_name,proc,end))
-        buffer.flush()
-        buffer.close()
-        return frame
+        return _decode(r.content, table=table)
 
     except:
         try: